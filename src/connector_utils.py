@@ -4,11 +4,12 @@ Provides mapping loaders and shared constants for transforming WDI data
 into domain-specific tables.
 """
 
-import csv
 import json
+from functools import lru_cache
 from pathlib import Path
 
 import pyarrow as pa
+import pyarrow.csv as pacsv
 from subsets_utils import validate
 
 MAPPINGS_DIR = Path(__file__).parent.parent / "mappings"
@@ -22,39 +23,53 @@ COMMON_COLUMN_DESCRIPTIONS = {
 }
 
 
+def _load_csv_mapping(filename: str, key: str, value: str) -> dict:
+    """Read a two-column mapping CSV into a {key: value} dict.
+
+    Parsed by Arrow's CSV reader in one call; both columns are read as
+    plain strings (no type inference, empty cells stay "").
+    """
+    table = pacsv.read_csv(
+        MAPPINGS_DIR / filename,
+        parse_options=pacsv.ParseOptions(newlines_in_values=True),
+        convert_options=pacsv.ConvertOptions(
+            include_columns=[key, value],
+            column_types={key: pa.string(), value: pa.string()},
+        ),
+    )
+    return dict(zip(table.column(key).to_pylist(), table.column(value).to_pylist()))
+
+
+@lru_cache(maxsize=1)
 def load_indicator_mapping() -> dict:
     """Load the indicator to table mapping from CSV file.
 
+    Parsed once per process; the returned dict is shared, so don't mutate it.
+
     Returns:
         Dict mapping indicator_name -> table_name.
     """
-    mapping_path = MAPPINGS_DIR / "indicator_table_mapping.csv"
-    indicator_to_table = {}
-    with open(mapping_path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            indicator_to_table[row["indicator_name"]] = row["table_name"]
-    return indicator_to_table
+    return _load_csv_mapping("indicator_table_mapping.csv", "indicator_name", "table_name")
 
 
+@lru_cache(maxsize=1)
 def load_indicator_to_column_mapping() -> dict:
     """Load the indicator name to column name mapping from CSV file.
 
+    Parsed once per process; the returned dict is shared, so don't mutate it.
+
     Returns:
         Dict mapping indicator_name -> column_name (snake_case).
     """
-    mapping_path = MAPPINGS_DIR / "indicator_to_col_name.csv"
-    indicator_to_column = {}
-    with open(mapping_path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            indicator_to_column[row["indicator_name"]] = row["column_name"]
-    return indicator_to_column
+    return _load_csv_mapping("indicator_to_col_name.csv", "indicator_name", "column_name")
 
 
+@lru_cache(maxsize=1)
 def load_table_metadata() -> dict:
     """Load table metadata (titles, descriptions) from JSON file.
 
+    Parsed once per process; the returned dict is shared, so don't mutate it.
+
     Returns:
         Dict keyed by table_name with title/description values.
     """
@@ -63,9 +78,12 @@ def load_table_metadata() -> dict:
         return json.load(f)
 
 
+@lru_cache(maxsize=1)
 def load_indicator_summaries() -> dict:
     """Load indicator summaries and convert to {indicator_code: description} format.
 
+    Parsed once per process; the returned dict is shared, so don't mutate it.
+
     Returns:
         Dict mapping indicator_code -> human-readable description.
     """
@@ -6,12 +6,12 @@ monthly prices for ~70 commodities and ~17 composite price indices from 1960.
 import re
 import io
 
-import pandas as pd
 import pyarrow as pa
+from openpyxl import load_workbook
 from subsets_utils import (
-    get, save_raw_file, load_raw_file,
+    stream, raw_writer, load_raw_file,
     merge, publish, validate,
-    load_state, save_state, data_hash,
+    load_states, save_state, data_hash,
 )
 from connector_utils import LICENSE
 
@@ -22,6 +22,8 @@ INDICES_ID = "wdi_commodity_price_indices_monthly"
 
 DATE_PATTERN = re.compile(r"(\d{4})M(\d{2})")
 
+CHUNK_BYTES = 64 << 10
+
 
 def _clean_name(name: str) -> str:
     return re.sub(r"\s*\*+\s*$", "", name).strip()
@@ -35,17 +37,39 @@ def _to_snake_case(name: str) -> str:
     return name
 
 
+def _is_blank(val) -> bool:
+    return val is None or not str(val).strip()
+
+
+def _read_sheet(content: bytes, sheet_name: str) -> list[list]:
+    """Read a worksheet as a rectangular grid of cell values (None for empty).
+
+    openpyxl's read-only mode streams the sheet XML; rows are padded to the
+    widest row since trailing empty cells are not emitted.
+    """
+    wb = load_workbook(io.BytesIO(content), read_only=True, data_only=True)
+    try:
+        rows = [list(r) for r in wb[sheet_name].iter_rows(values_only=True)]
+    finally:
+        wb.close()
+    width = max((len(r) for r in rows), default=0)
+    for r in rows:
+        r.extend([None] * (width - len(r)))
+    return rows
+
+
 def _parse_sheet(content: bytes, sheet_name: str) -> tuple[pa.Table, dict]:
     """Parse a Pink Sheet data sheet into a wide PyArrow table.
 
     Handles both single-row headers (prices) and multi-row hierarchical
     headers (indices). Detects units rows by checking for $/unit patterns.
     """
-    df = pd.read_excel(io.BytesIO(content), sheet_name=sheet_name, header=None)
+    rows = _read_sheet(content, sheet_name)
+    n_cols = len(rows[0]) if rows else 0
 
     data_start = None
-    for i in range(len(df)):
-        val = str(df.iloc[i, 0]).strip()
+    for i in range(len(rows)):
+        val = str(rows[i][0]).strip()
         if DATE_PATTERN.match(val):
             data_start = i
             break
@@ -56,8 +80,8 @@ def _parse_sheet(content: bytes, sheet_name: str) -> tuple[pa.Table, dict]:
     header_start = data_start
     for i in range(data_start):
         non_empty = sum(
-            1 for j in range(1, len(df.columns))
-            if pd.notna(df.iloc[i, j]) and str(df.iloc[i, j]).strip()
+            1 for j in range(1, n_cols)
+            if not _is_blank(rows[i][j])
         )
         if non_empty >= 2:
             header_start = i
@@ -68,9 +92,9 @@ def _parse_sheet(content: bytes, sheet_name: str) -> tuple[pa.Table, dict]:
     last_header = data_start - 1
     if last_header >= header_start:
         sample = [
-            str(df.iloc[last_header, j]).strip()
-            for j in range(1, min(len(df.columns), 20))
-            if pd.notna(df.iloc[last_header, j]) and str(df.iloc[last_header, j]).strip()
+            str(rows[last_header][j]).strip()
+            for j in range(1, min(n_cols, 20))
+            if not _is_blank(rows[last_header][j])
         ]
         if sample:
             unit_like = sum(1 for v in sample if "$" in v or "/" in v)
@@ -86,12 +110,12 @@ def _parse_sheet(content: bytes, sheet_name: str) -> tuple[pa.Table, dict]:
     }
     seen_names = {}
 
-    for col_idx in range(1, len(df.columns)):
+    for col_idx in range(1, n_cols):
         # Take the deepest (last) non-empty name across all header rows
         name = None
         for i in range(header_start, name_end):
-            val = df.iloc[i, col_idx]
-            if pd.notna(val) and str(val).strip():
+            val = rows[i][col_idx]
+            if not _is_blank(val):
                 name = str(val).strip()
         if not name:
             continue
@@ -109,8 +133,8 @@ def _parse_sheet(content: bytes, sheet_name: str) -> tuple[pa.Table, dict]:
 
         unit_str = ""
         if units_row is not None:
-            unit = df.iloc[units_row, col_idx]
-            if pd.notna(unit):
+            unit = rows[units_row][col_idx]
+            if unit is not None:
                 unit_str = str(unit).strip()
 
         commodities.append((col_idx, name, snake))
@@ -121,8 +145,8 @@ def _parse_sheet(content: bytes, sheet_name: str) -> tuple[pa.Table, dict]:
         col_descriptions[snake] = desc
 
     records = []
-    for i in range(data_start, len(df)):
-        date_val = str(df.iloc[i, 0]).strip()
+    for i in range(data_start, len(rows)):
+        date_val = str(rows[i][0]).strip()
         m = DATE_PATTERN.match(date_val)
         if not m:
             continue
@@ -131,8 +155,8 @@ def _parse_sheet(content: bytes, sheet_name: str) -> tuple[pa.Table, dict]:
         has_value = False
 
         for col_idx, _, snake in commodities:
-            val = df.iloc[i, col_idx]
-            if pd.isna(val):
+            val = rows[i][col_idx]
+            if val is None:
                 row[snake] = None
                 continue
             val_str = str(val).strip()
@@ -154,13 +178,19 @@ def _parse_sheet(content: bytes, sheet_name: str) -> tuple[pa.Table, dict]:
 def download():
     """Download the Pink Sheet Excel file."""
     print("Downloading World Bank Pink Sheet (monthly)...")
-    response = get(MONTHLY_URL, timeout=120)
-    response.raise_for_status()
-    save_raw_file(response.content, "pink_sheet_monthly", extension="xlsx")
+    with stream("GET", MONTHLY_URL, timeout=120) as response:
+        response.raise_for_status()
+        # Copy the body to the raw file chunk by chunk instead of holding the
+        # whole workbook in memory as response.content first.
+        with raw_writer("pink_sheet_monthly", "xlsx") as f:
+            for chunk in response.iter_bytes(CHUNK_BYTES):
+                f.write(chunk)
 
 
 def transform():
     """Parse Pink Sheet Excel and publish commodity price tables."""
+    # Both tables' prior hashes in one concurrent fetch, before parsing.
+    prior_states = load_states([PRICES_ID, INDICES_ID])
     content = load_raw_file("pink_sheet_monthly", extension="xlsx", binary=True)
 
     print("Parsing Monthly Prices...")
@@ -174,7 +204,7 @@ def transform():
     })
 
     h = data_hash(prices_table)
-    if load_state(PRICES_ID).get("hash") != h:
+    if prior_states[PRICES_ID].get("hash") != h:
         merge(prices_table, PRICES_ID, key=["year", "month"])
         publish(PRICES_ID, {
             "id": PRICES_ID,
@@ -199,7 +229,7 @@ def transform():
     })
 
     h = data_hash(indices_table)
-    if load_state(INDICES_ID).get("hash") != h:
+    if prior_states[INDICES_ID].get("hash") != h:
         merge(indices_table, INDICES_ID, key=["year", "month"])
         publish(INDICES_ID, {
             "id": INDICES_ID,
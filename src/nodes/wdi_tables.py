@@ -6,11 +6,14 @@
 - Uploads each domain table with metadata
 - Skips unchanged tables via data_hash + state
 """
-import duckdb
+import contextvars
+import re
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
 import pyarrow as pa
 import pyarrow.compute as pc
-from subsets_utils import load_state, save_state, merge, publish, data_hash
-from subsets_utils.duckdb import raw
+from subsets_utils import load_state, load_states, save_state, merge, publish, data_hash
+from subsets_utils.duckdb import get_conn, raw
 from nodes import ingest
 from connector_utils import (
     LICENSE,
@@ -22,6 +25,26 @@ from connector_utils import (
     validate_wdi_table,
 )
 
+# Domain tables are independent Delta tables, so their merge + publish run on
+# a small pool (deltalake releases the GIL) while the main thread pivots the
+# next one. At most 2x this many built tables wait in memory for a writer.
+WRITE_WORKERS = 4
+
+
+def _decode_dictionaries(table: pa.Table) -> pa.Table:
+    """Cast dictionary-encoded columns back to their plain value type."""
+    return table.cast(pa.schema([
+        f.with_type(f.type.value_type) if pa.types.is_dictionary(f.type) else f
+        for f in table.schema
+    ]))
+
+
+def _write_table(table: pa.Table, table_name: str, key: list[str], metadata: dict, h: str):
+    """Merge a table, publish its metadata and record its hash in state."""
+    merge(table, table_name, key=key)
+    publish(table_name, metadata)
+    save_state(table_name, {"hash": h})
+
 
 def run():
     """Transform WDI data to domain-specific tables."""
@@ -42,9 +65,10 @@ def run():
 
     # Query main data and country mapping via DuckDB
     print("  Loading data via DuckDB...")
+    conn = get_conn()
 
     # Get country code mapping (3-letter to 2-letter)
-    country_df = duckdb.sql(f"""
+    country_df = conn.sql(f"""
         SELECT
             "Country Code" as country_code3,
             "2-alpha code" as country_code2
@@ -54,17 +78,33 @@ def run():
 
     # Get main WDI data, unpivot from wide to long format
     # Detect year columns dynamically
-    schema_query = duckdb.sql(f"SELECT * FROM {raw('wdicsv')} LIMIT 0")
+    schema_query = conn.sql(f"SELECT * FROM {raw('wdicsv')} LIMIT 0")
     columns = schema_query.columns
 
-    # Year columns are those that look like years (4-digit numbers or YRxxxx)
-    year_cols = [c for c in columns if c not in ['Country Name', 'Country Code', 'Indicator Name', 'Indicator Code']
-                 and not c.startswith('Unnamed')]
+    # Year columns are those that look like years (4-digit numbers or YRxxxx):
+    # everything but ingest's id columns (one shared definition, set lookup)
+    id_columns = frozenset(ingest.WDICSV_ID_COLUMNS)
+    year_cols = [c for c in columns if c not in id_columns and not c.startswith('Unnamed')]
 
     # Build UNPIVOT query
     year_cols_quoted = ', '.join([f'"{c}"' for c in year_cols])
 
-    wdi_long = duckdb.sql(f"""
+    # Parse each year header ("1960", "YR1960", ...) once here rather than
+    # running a regex + cast on every unpivoted cell; the query joins this
+    # one-row-per-column lookup instead.
+    year_lookup = pa.table({
+        "year_str": pa.array(year_cols, type=pa.string()),
+        "year": pa.array(
+            [int(d) if (d := re.sub(r"[^0-9]", "", c)) else None for c in year_cols],
+            type=pa.int32(),
+        ),
+    })
+
+    # Unpivot and attach alpha-2 codes in a single pass so the long table is
+    # only materialized once (as Arrow) rather than once per step. The inner
+    # join drops aggregates without an alpha-2 code here, once, instead of
+    # every consumer below re-filtering on `country_code2 IS NOT NULL`.
+    wdi_long_df = conn.sql(f"""
         WITH unpivoted AS (
             UNPIVOT {raw('wdicsv')}
             ON {year_cols_quoted}
@@ -73,178 +113,181 @@ def run():
                 VALUE value
         )
         SELECT
-            "Country Name" as country_name,
-            "Country Code" as country_code3,
-            "Indicator Name" as indicator_name,
-            "Indicator Code" as indicator_code,
-            CAST(REGEXP_REPLACE(year_str, '[^0-9]', '', 'g') AS INTEGER) as year,
-            CAST(value AS DOUBLE) as value
-        FROM unpivoted
-        WHERE value IS NOT NULL
+            u."Country Name" as country_name,
+            c.country_code2,
+            u."Indicator Name" as indicator_name,
+            u."Indicator Code" as indicator_code,
+            y.year,
+            CAST(u.value AS DOUBLE) as value
+        FROM unpivoted u
+        JOIN year_lookup y ON u.year_str = y.year_str
+        JOIN country_df c ON u."Country Code" = c.country_code3
+        WHERE u.value IS NOT NULL
     """).arrow()
 
-    print(f"  Processed {len(wdi_long):,} WDI data records")
+    print(f"  Processed {len(wdi_long_df):,} WDI data records")
 
-    # Join with country codes
-    wdi_long_df = duckdb.sql("""
-        SELECT
-            w.country_name,
-            c.country_code2,
-            w.indicator_name,
-            w.indicator_code,
-            w.year,
-            w.value
-        FROM wdi_long w
-        LEFT JOIN country_df c ON w.country_code3 = c.country_code3
-    """).arrow()
+    # indicator_name / indicator_code repeat on every (country, year) row.
+    # Dictionary-encode them so the long table and each per-table slice carry
+    # int32 indices into one shared dictionary instead of copies of the strings.
+    for col in ("indicator_name", "indicator_code"):
+        wdi_long_df = wdi_long_df.set_column(
+            wdi_long_df.schema.get_field_index(col), col,
+            wdi_long_df[col].dictionary_encode(),
+        )
+    wdi_long_df = wdi_long_df.unify_dictionaries()
+
+    # indicator_name → indicator_code, built once with a single group_by over
+    # the long table rather than once per domain table inside the loop.
+    name_code_pairs = (
+        wdi_long_df
+        .select(['indicator_name', 'indicator_code'])
+        .group_by(['indicator_name', 'indicator_code'])
+        .aggregate([])
+    )
+    name_to_code = dict(zip(
+        name_code_pairs.column('indicator_name').to_pylist(),
+        name_code_pairs.column('indicator_code').to_pylist(),
+    ))
 
     # Split by table and transform to wide format
     table_names = set(indicator_mapping.values())
     print(f"  Splitting data into {len(table_names)} domain tables...")
 
     transformed_tables = []
-
-    for table_name in sorted(table_names):
-        # Get indicators for this table
-        indicators_for_table = [ind for ind, tbl in indicator_mapping.items() if tbl == table_name]
-
-        if not indicators_for_table:
-            continue
-
-        # Filter data for this table
-        indicators_set = set(indicators_for_table)
-        indicator_mask = pc.is_in(wdi_long_df.column('indicator_name'), value_set=pa.array(list(indicators_set)))
-        table_data = wdi_long_df.filter(indicator_mask)
-
-        if len(table_data) == 0:
-            continue
-
-        print(f"    {table_name}: {len(table_data):,} records")
-
-        # Drop rows without a country_code2 (aggregates that don't have an
-        # alpha-2 code). Matches the old `WHERE country_code2 IS NOT NULL`.
-        table_data = table_data.filter(pc.is_valid(table_data['country_code2']))
-        if len(table_data) == 0:
-            continue
-
-        # Long → wide via explicit pyarrow joins. No aggregate: for each
-        # indicator, filter the long table down to its rows, rename the
-        # `value` column to the indicator's snake_case column name, and
-        # left-outer-join it onto a base of distinct (country, year) keys.
-        # Every join contributes exactly one column and preserves the
-        # source values cell-for-cell.
-        col_mapping = {
-            ind: indicator_to_column.get(ind, ind)
-            for ind in indicators_for_table
-        }
-
-        wide_table = (
-            table_data
-            .select(['country_name', 'country_code2', 'year'])
-            .group_by(['country_name', 'country_code2', 'year'])
-            .aggregate([])  # empty agg → distinct keys
-        )
-
-        indicator_list = [
-            ind for ind in indicators_for_table
-            if ind in col_mapping
-        ]
-        for ind in indicator_list:
-            col_name = col_mapping[ind]
-            sub = (
-                table_data
-                .filter(pc.equal(table_data['indicator_name'], ind))
-                .select(['country_name', 'country_code2', 'year', 'value'])
-            )
-            if len(sub) == 0:
-                continue
-            sub = sub.rename_columns(['country_name', 'country_code2', 'year', col_name])
-            wide_table = wide_table.join(
-                sub,
-                keys=['country_name', 'country_code2', 'year'],
-                join_type='left outer',
-            )
-
-        wide_table = wide_table.sort_by([
-            ('country_name', 'ascending'),
-            ('year', 'ascending'),
-        ])
-
-        if len(wide_table) == 0:
-            continue
-
-        print(f"      -> {len(wide_table):,} rows x {len(wide_table.schema)} columns")
-
-        # Build column descriptions
-        column_descriptions = dict(COMMON_COLUMN_DESCRIPTIONS)
-
-        # Build one (indicator_name → indicator_code) map per segment via a
-        # single group_by, then look each up in indicator_summaries.
-        name_code_pairs = (
-            table_data
-            .select(['indicator_name', 'indicator_code'])
-            .group_by(['indicator_name', 'indicator_code'])
-            .aggregate([])
-        )
-        name_to_code = dict(zip(
-            name_code_pairs.column('indicator_name').to_pylist(),
-            name_code_pairs.column('indicator_code').to_pylist(),
-        ))
-        for ind_name, code in name_to_code.items():
-            if code in indicator_summaries:
-                col_name = col_mapping.get(ind_name)
-                if col_name:
-                    column_descriptions[col_name] = indicator_summaries[code]
-
-        # Validate before upload
-        validate_wdi_table(wide_table, table_name)
-
-        # Skip unchanged tables
-        h = data_hash(wide_table)
-        if load_state(table_name).get("hash") == h:
-            print(f"      Skipping {table_name} - unchanged")
-            transformed_tables.append(table_name)
-            continue
-
-        # Upload data
-        merge(wide_table, table_name, key=["country_name", "country_code2", "year"])
-
-        # Build and publish metadata
-        meta = table_metadata.get(table_name, {})
-        metadata = {
-            "id": table_name,
-            "title": f"WDI {meta.get('title', table_name)}",
-            "description": meta.get("description", f"World Development Indicators data for {table_name}."),
-            "license": LICENSE,
-            "column_descriptions": column_descriptions,
-        }
-        publish(table_name, metadata)
-        save_state(table_name, {"hash": h})
-
-        transformed_tables.append(table_name)
-
-    # Handle unmapped indicators
-    mapped_indicators = set(indicator_mapping.keys())
-    all_indicators_query = duckdb.sql("""
-        SELECT DISTINCT indicator_name
-        FROM wdi_long_df
-    """).fetchall()
-    all_indicators = {row[0] for row in all_indicators_query}
-    unmapped = all_indicators - mapped_indicators
-
-    if unmapped:
-        print(f"\n  Found {len(unmapped)} unmapped indicators")
-        unmapped_mask = pc.is_in(wdi_long_df.column('indicator_name'), value_set=pa.array(list(unmapped)))
-        unmapped_table = wdi_long_df.filter(unmapped_mask)
-
-        if len(unmapped_table) > 0:
-            # Filter to only rows with valid country codes
-            valid_mask = pc.is_valid(unmapped_table.column('country_code2'))
-            unmapped_table = unmapped_table.filter(valid_mask)
-
+    prior_states = load_states(sorted(table_names) + ["wdi_unmapped"])
+
+    # Tag every row with its domain table once: index_in maps each
+    # indicator_name to its position in the mapping and take turns that into
+    # the table name (null for unmapped indicators).
+    row_table_name = pc.take(
+        pa.array(list(indicator_mapping.values()), type=pa.string()),
+        pc.index_in(
+            wdi_long_df.column('indicator_name'),
+            value_set=pa.array(list(indicator_mapping.keys()), type=pa.string()),
+        ),
+    ).dictionary_encode().combine_chunks()
+
+    # Partition in one pass: a stable sort on the table-name codes groups
+    # each table's rows together (keeping their source order), so a single
+    # take gathers every table and each one is then a zero-copy slice of
+    # the result. Unmapped rows (null code) sort to the end.
+    partitioned = wdi_long_df.take(pc.sort_indices(row_table_name.indices))
+    code_counts = pc.value_counts(row_table_name.indices.drop_null())
+    table_slices = {}
+    offset = 0
+    for code, count in sorted(zip(
+        code_counts.field('values').to_pylist(),
+        code_counts.field('counts').to_pylist(),
+    )):
+        table_slices[row_table_name.dictionary[code].as_py()] = (offset, count)
+        offset += count
+
+    with ThreadPoolExecutor(max_workers=WRITE_WORKERS) as pool:
+        in_flight = set()
+        try:
+            for table_name in sorted(table_names):
+                if table_name not in table_slices:
+                    continue
+
+                # Get indicators for this table
+                indicators_for_table = [ind for ind, tbl in indicator_mapping.items() if tbl == table_name]
+                table_data = partitioned.slice(*table_slices[table_name])
+
+                print(f"    {table_name}: {len(table_data):,} records")
+
+                # Long → wide in a single DuckDB PIVOT pass: one column per
+                # indicator, grouped on the (country, year) keys. WDI has exactly
+                # one value per (country, indicator, year), so first(value) just
+                # carries the source value through cell-for-cell. There is no IN
+                # list: DuckDB derives the pivot columns from the data itself, so no
+                # indicator name is ever spliced into the SQL text. The pivoted
+                # columns are named after the indicators; select them in mapping
+                # order and rename to their snake_case names.
+                col_mapping = {
+                    ind: indicator_to_column.get(ind, ind)
+                    for ind in indicators_for_table
+                }
+
+                keys = ['country_name', 'country_code2', 'year']
+                wide_table = conn.sql("""
+                    PIVOT table_data
+                    ON indicator_name
+                    USING first(value)
+                    GROUP BY country_name, country_code2, year
+                """).arrow()
+                pivoted = set(wide_table.column_names)
+                indicator_list = [ind for ind in indicators_for_table if ind in pivoted]
+                wide_table = wide_table.select(keys + indicator_list).rename_columns(
+                    keys + [col_mapping[ind] for ind in indicator_list]
+                )
+
+                # Cluster rows on the (country, year) filter columns so the Delta
+                # files' per-row-group min/max stats let readers skip most groups.
+                # This only lands in storage when the table is first created: the
+                # skip hash ignores row order, and merging into an existing table
+                # writes rows in the merge's own order.
+                wide_table = wide_table.sort_by([
+                    ('country_code2', 'ascending'),
+                    ('year', 'ascending'),
+                ])
+
+                if len(wide_table) == 0:
+                    continue
+
+                print(f"      -> {len(wide_table):,} rows x {len(wide_table.schema)} columns")
+
+                # Build column descriptions
+                column_descriptions = dict(COMMON_COLUMN_DESCRIPTIONS)
+
+                for ind_name in indicator_list:
+                    code = name_to_code.get(ind_name)
+                    if code in indicator_summaries:
+                        column_descriptions[col_mapping[ind_name]] = indicator_summaries[code]
+
+                # Validate before upload
+                validate_wdi_table(wide_table, table_name)
+
+                # Skip unchanged tables
+                h = data_hash(wide_table)
+                if prior_states[table_name].get("hash") == h:
+                    print(f"      Skipping {table_name} - unchanged")
+                    transformed_tables.append(table_name)
+                    continue
+
+                # Upload data and publish metadata
+                meta = table_metadata.get(table_name, {})
+                metadata = {
+                    "id": table_name,
+                    "title": f"WDI {meta.get('title', table_name)}",
+                    "description": meta.get("description", f"World Development Indicators data for {table_name}."),
+                    "license": LICENSE,
+                    "column_descriptions": column_descriptions,
+                }
+                # Bound the backlog, surfacing any finished write's error as we go.
+                if len(in_flight) >= 2 * WRITE_WORKERS:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for f in done:
+                        f.result()
+                # copy_context carries the orchestrator's task ID into the
+                # worker so the merge is still attributed to this node.
+                in_flight.add(pool.submit(
+                    contextvars.copy_context().run, _write_table,
+                    wide_table, table_name, ["country_name", "country_code2", "year"], metadata, h,
+                ))
+
+                transformed_tables.append(table_name)
+
+            # Handle unmapped indicators: they carry a null table name, so they are
+            # the tail of the partitioned table after every mapped slice.
+            unmapped_table = partitioned.slice(offset)
             if len(unmapped_table) > 0:
+                unmapped_count = len(pc.unique(unmapped_table.column('indicator_name')))
+                print(f"\n  Found {unmapped_count} unmapped indicators")
+
+                unmapped_table = _decode_dictionaries(unmapped_table)
                 h = data_hash(unmapped_table)
-                if load_state("wdi_unmapped").get("hash") == h:
+                if prior_states["wdi_unmapped"].get("hash") == h:
                     print(f"    Skipping wdi_unmapped - unchanged")
                     transformed_tables.append("wdi_unmapped")
                 else:
@@ -267,6 +310,14 @@ def run():
                     print(f"    Saved {len(unmapped_table):,} unmapped records")
                     transformed_tables.append("wdi_unmapped")
 
+            for f in in_flight:
+                f.result()
+        except BaseException:
+            # Don't leave queued merges committing after the node has failed;
+            # the pool's exit still waits for any already running.
+            pool.shutdown(cancel_futures=True)
+            raise
+
     save_state("wdi_tables", {"transformed_tables": sorted(transformed_tables)})
     print(f"\n  Complete! Transformed {len(transformed_tables)} tables")
 
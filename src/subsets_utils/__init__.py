@@ -1,6 +1,6 @@
-from .http_client import get, post, put, delete, get_client, configure_http
+from .http_client import get, post, put, delete, stream, get_client, configure_http
 from .io import (
-    load_state, save_state, load_asset,
+    load_state, load_states, save_state, load_asset, load_asset_dataset,
     save_raw_json, load_raw_json,
     save_raw_file, load_raw_file,
     save_raw_parquet, load_raw_parquet, raw_parquet_localpath,
@@ -18,13 +18,13 @@ from . import catalog
 
 __all__ = [
     # HTTP
-    'get', 'post', 'put', 'delete', 'get_client', 'configure_http',
+    'get', 'post', 'put', 'delete', 'stream', 'get_client', 'configure_http',
     # Delta writes
     'merge', 'overwrite', 'append', 'validate_asset', 'WriteResult',
     # Publishing
     'publish',
     # State & raw I/O
-    'load_state', 'save_state', 'load_asset', 'data_hash', 'raw_parquet_hash',
+    'load_state', 'load_states', 'save_state', 'load_asset', 'load_asset_dataset', 'data_hash', 'raw_parquet_hash',
     'save_raw_json', 'load_raw_json', 'save_raw_file', 'load_raw_file',
     'save_raw_parquet', 'load_raw_parquet', 'raw_parquet_localpath',
     'list_raw_files', 'delete_raw_file',
@@ -6,6 +6,7 @@ which URI a path-builder returns.
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -72,7 +73,18 @@ def get_mirror_root() -> Path | None:
     path doesn't exist (e.g. SSD not mounted) — callers should handle that
     gracefully by skipping the fallback.
     """
-    root = Path(os.environ.get('SUBSETS_MIRROR_ROOT', _MIRROR_ROOT_DEFAULT))
+    return _existing_dir(os.environ.get('SUBSETS_MIRROR_ROOT', _MIRROR_ROOT_DEFAULT))
+
+
+@lru_cache(maxsize=8)
+def _existing_dir(path: str) -> Path | None:
+    """Path(path) if it exists, else None — stat'ed once per distinct path.
+
+    Every raw/state read builds its mirror path up front, so without this
+    each one paid a stat() on the (usually unmounted) mirror root. Keyed on
+    the path string, so changing SUBSETS_MIRROR_ROOT still takes effect.
+    """
+    root = Path(path)
     return root if root.exists() else None
 
 
@@ -121,13 +133,26 @@ def validate_environment(additional_required: list[str] = None):
 # =============================================================================
 
 def get_storage_options() -> dict | None:
-    """Get storage options for DeltaLake S3 writes. Returns None for local mode."""
+    """Get storage options for DeltaLake S3 writes. Returns None for local mode.
+
+    The dict is shared between calls; treat it as read-only.
+    """
     if not is_cloud():
         return None
+    return _r2_storage_options(
+        os.environ['R2_ACCOUNT_ID'],
+        os.environ['R2_ACCESS_KEY_ID'],
+        os.environ['R2_SECRET_ACCESS_KEY'],
+    )
+
+
+@lru_cache(maxsize=4)
+def _r2_storage_options(account_id: str, access_key: str, secret_key: str) -> dict:
+    # Built once per credential set rather than on every DeltaTable open.
     return {
-        'AWS_ENDPOINT_URL': f"https://{os.environ['R2_ACCOUNT_ID']}.r2.cloudflarestorage.com",
-        'AWS_ACCESS_KEY_ID': os.environ['R2_ACCESS_KEY_ID'],
-        'AWS_SECRET_ACCESS_KEY': os.environ['R2_SECRET_ACCESS_KEY'],
+        'AWS_ENDPOINT_URL': f"https://{account_id}.r2.cloudflarestorage.com",
+        'AWS_ACCESS_KEY_ID': access_key,
+        'AWS_SECRET_ACCESS_KEY': secret_key,
         'AWS_REGION': 'auto',
         'AWS_S3_ALLOW_UNSAFE_RENAME': 'true',
     }
@@ -162,6 +187,17 @@ def get_fsspec_storage_options(uri: str) -> dict:
         "key": os.environ["R2_ACCESS_KEY_ID"],
         "secret": os.environ["R2_SECRET_ACCESS_KEY"],
         "client_kwargs": {"region_name": "auto"},
+        # Multipart parts go out concurrently (pipe_file/put_file), and one
+        # s3fs instance per process serves every thread (see _s3_filesystem).
+        # Up to 36 threads can hit it at once: load_states' 16, the runner's
+        # 16 log uploaders and wdi_tables' 4 writers. 64 connections cover
+        # those plus one multipart put's parts; past that aiohttp queues
+        # requests rather than failing them.
+        "max_concurrency": 16,
+        "config_kwargs": {
+            "max_pool_connections": 64,
+            "retries": {"mode": "adaptive"},
+        },
     }
 
 
@@ -172,12 +208,37 @@ def get_fs(uri: str = ""):
     For everything else returns the local filesystem with auto_mkdir so
     parent dirs are created transparently on open.
     """
-    import fsspec
     if uri.startswith("s3://"):
-        return fsspec.filesystem("s3", **get_fsspec_storage_options("s3://"))
+        return _s3_filesystem(
+            os.getpid(),
+            os.environ['R2_ACCOUNT_ID'],
+            os.environ['R2_ACCESS_KEY_ID'],
+            os.environ['R2_SECRET_ACCESS_KEY'],
+        )
+    return _local_filesystem()
+
+
+# get_fs runs on every raw/state read and write. fsspec caches instances
+# too, but only after tokenizing the kwargs on each call; these skip that.
+# The s3 one is keyed on the credentials, so rotating them still applies,
+# and on the pid: s3fs instances hold an event loop that must not cross a
+# fork, so each forked DAG node builds its own. It is shared across threads,
+# as fsspec's own cache does for async filesystems: every thread's s3fs call
+# already runs on fsspec's single IO loop, so per-thread instances would only
+# multiply the connection pools sized in get_fsspec_storage_options.
+
+@lru_cache(maxsize=1)
+def _local_filesystem():
+    import fsspec
     return fsspec.filesystem("file", auto_mkdir=True)
 
 
+@lru_cache(maxsize=4)
+def _s3_filesystem(pid: int, account_id: str, access_key: str, secret_key: str):
+    import fsspec
+    return fsspec.filesystem("s3", **get_fsspec_storage_options("s3://"))
+
+
 # =============================================================================
 # Path / URI Builders
 #
@@ -9,7 +9,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Union
 import pyarrow as pa
-from deltalake import write_deltalake, DeltaTable, CommitProperties
+import pyarrow.compute as pc
+from deltalake import write_deltalake, DeltaTable, CommitProperties, WriterProperties
 try:
     from deltalake.exceptions import TableNotFoundError
 except ImportError:
@@ -64,6 +65,19 @@ def _run_commit_properties() -> CommitProperties | None:
     return CommitProperties(custom_metadata=meta) if meta else None
 
 
+# Parquet layout for every write and merge: ~1 MiB data pages, and row groups
+# capped at 64k rows so min/max stats on clustered columns stay selective
+# inside large files. Files target 256 MiB, so a table is a few large
+# objects rather than many small ones (fewer PUTs, smaller log entries).
+_WRITER_PROPERTIES = WriterProperties(
+    compression="SNAPPY",
+    data_page_size_limit=1 << 20,
+    dictionary_page_size_limit=2 << 20,
+    max_row_group_size=64_000,
+)
+_TARGET_FILE_SIZE = 256 * 1024 * 1024
+
+
 @dataclass
 class WriteResult:
     uri: str
@@ -102,22 +116,27 @@ def validate_asset(
     opts = _get_opts()
 
     try:
-        dt = DeltaTable(uri, storage_options=opts)
-        table = dt.to_pyarrow_table()
+        dt = open_table(uri, opts)
     except Exception as e:
         raise FileNotFoundError(f"Asset '{name}' not found: {e}")
 
+    # The row count and column list come from the Delta log and parquet
+    # footers; only the key columns are ever scanned, and only with a key.
+    dataset = dt.to_pyarrow_dataset()
+    column_names = dataset.schema.names
+    row_count = dataset.count_rows()
+
     report = {
         "name": name,
-        "row_count": len(table),
-        "columns": table.column_names,
+        "row_count": row_count,
+        "columns": column_names,
         "issues": [],
         "needs_cleanup": False
     }
 
     # Check expected columns
     if expected_columns:
-        missing = set(expected_columns) - set(table.column_names)
+        missing = set(expected_columns) - set(column_names)
         if missing:
             report["issues"].append(f"Missing columns: {missing}")
             report["needs_cleanup"] = True
@@ -128,11 +147,13 @@ def validate_asset(
         report["key"] = keys
 
         # Check key columns exist
-        missing_keys = [k for k in keys if k not in table.column_names]
+        missing_keys = [k for k in keys if k not in column_names]
         if missing_keys:
             report["issues"].append(f"Key columns missing: {missing_keys}")
             report["needs_cleanup"] = True
         else:
+            table = dataset.to_table(columns=keys)
+
             # Check nulls in key columns
             key_nulls = {}
             for k in keys:
@@ -144,18 +165,10 @@ def validate_asset(
                 report["issues"].append(f"Nulls in key columns: {key_nulls}")
                 report["needs_cleanup"] = True
 
-            # Check duplicates
-            import pyarrow.compute as pc
-            if len(keys) == 1:
-                unique_count = len(table[keys[0]].unique())
-            else:
-                combined = pc.binary_join_element_wise(
-                    *[pc.cast(table[k], pa.string()) for k in keys],
-                    "||"
-                )
-                unique_count = len(combined.unique())
-
-            dup_count = len(table) - unique_count
+            # Check duplicates on the typed key columns, as in _validate_keys
+            unique_count = table.select(keys).group_by(keys).aggregate([]).num_rows
+
+            dup_count = row_count - unique_count
             if dup_count > 0:
                 report["key_duplicates"] = dup_count
                 report["issues"].append(f"{dup_count} duplicate key combinations")
@@ -165,11 +178,38 @@ def validate_asset(
     if report["needs_cleanup"]:
         print(f"⚠️  [{name}] Needs cleanup: {', '.join(report['issues'])}")
     else:
-        print(f"✅ [{name}] Valid: {len(table):,} rows, key={key}")
+        print(f"✅ [{name}] Valid: {row_count:,} rows, key={key}")
 
     return report
 
 
+# Open DeltaTables by URI for this process. Re-opening replays the whole
+# _delta_log; a cached handle only needs update_incremental() to pick up
+# commits made since (by us or anyone else). Keyed to the pid like the
+# DuckDB connection: the Rust object-store client must not cross a fork.
+_tables: dict[str, DeltaTable] = {}
+_tables_pid: int | None = None
+
+
+def open_table(uri: str, storage_options: dict | None = None) -> DeltaTable:
+    """Return an up-to-date DeltaTable for `uri`, reusing this process's handle.
+
+    Raises whatever DeltaTable() raises if the table doesn't exist; misses
+    are not cached.
+    """
+    global _tables_pid
+    if _tables_pid != os.getpid():
+        _tables.clear()
+        _tables_pid = os.getpid()
+    dt = _tables.get(uri)
+    if dt is None:
+        dt = DeltaTable(uri, storage_options=storage_options)
+        _tables[uri] = dt
+    else:
+        dt.update_incremental()
+    return dt
+
+
 def _get_uri(name: str) -> str:
     """Get Delta table URI based on environment."""
     if is_cloud():
@@ -191,8 +231,8 @@ def _target_row_count(dt: DeltaTable) -> int:
     try:
         # deltalake ≥1.0 returns an arro3 RecordBatch; bridge to pyarrow.
         batch = pa.record_batch(dt.get_add_actions(flatten=True))
-        col = batch.column("num_records")
-        return int(sum(v for v in col.to_pylist() if v is not None))
+        # Summed in Arrow: one kernel call however many files the table has.
+        return int(pc.sum(batch.column("num_records")).as_py() or 0)
     except Exception:
         return -1
 
@@ -270,33 +310,21 @@ def _validate_keys(table: pa.Table, keys: list[str], name: str):
         if null_count > 0:
             raise ValueError(f"[{name}] Key column '{k}' has {null_count} nulls. Merge keys cannot be null.")
 
-    # Check uniqueness - group by keys and look for duplicates
-    if len(keys) == 1:
-        # Single key - use value_counts
-        key_col = table[keys[0]]
-        unique_count = len(key_col.unique())
-        if unique_count != len(table):
-            dup_count = len(table) - unique_count
+    # Check uniqueness - group by keys and look for duplicates. Arrow's hash
+    # group_by compares the typed key columns directly, so composite keys
+    # no longer get cast to strings and joined into one concatenated column.
+    unique_count = table.select(keys).group_by(keys).aggregate([]).num_rows
+    if unique_count != len(table):
+        dup_count = len(table) - unique_count
+        if len(keys) == 1:
             raise ValueError(
                 f"[{name}] Key '{keys[0]}' has {dup_count} duplicate values. "
                 f"Merge key must be unique. Check your data or add more columns to key."
             )
-    else:
-        # Composite key - need to check combination
-        import pyarrow.compute as pc
-
-        # Concatenate key columns as strings for uniqueness check
-        combined = pc.binary_join_element_wise(
-            *[pc.cast(table[k], pa.string()) for k in keys],
-            "||"
+        raise ValueError(
+            f"[{name}] Key {keys} has {dup_count} duplicate combinations. "
+            f"Merge key must be unique. Check your data or add more columns to key."
         )
-        unique_count = len(combined.unique())
-        if unique_count != len(table):
-            dup_count = len(table) - unique_count
-            raise ValueError(
-                f"[{name}] Key {keys} has {dup_count} duplicate combinations. "
-                f"Merge key must be unique. Check your data or add more columns to key."
-            )
 
 
 def merge(
@@ -358,7 +386,7 @@ def merge(
     # silently fall back to overwrite mode because that would destroy an
     # existing table's contents on a transient merge failure.
     try:
-        dt = DeltaTable(uri, storage_options=opts)
+        dt = open_table(uri, opts)
         table_exists = True
     except Exception as e:
         if not _is_table_not_found(e):
@@ -372,9 +400,11 @@ def merge(
             mode="overwrite",
             partition_by=partition_by,
             storage_options=opts,
+            target_file_size=_TARGET_FILE_SIZE,
+            writer_properties=_WRITER_PROPERTIES,
             commit_properties=_run_commit_properties(),
         )
-        dt = DeltaTable(uri, storage_options=opts)
+        dt = open_table(uri, opts)
         new_count = _target_row_count(dt)
         version = dt.version()
         h = _source_hash(source, schema, new_count)
@@ -389,6 +419,7 @@ def merge(
             predicate=predicate,
             source_alias="source",
             target_alias="target",
+            writer_properties=_WRITER_PROPERTIES,
             commit_properties=_run_commit_properties(),
         ).when_matched_update(
             updates=updates
@@ -447,10 +478,12 @@ def overwrite(
         partition_by=partition_by,
         storage_options=opts,
         schema_mode="overwrite",
+        target_file_size=_TARGET_FILE_SIZE,
+        writer_properties=_WRITER_PROPERTIES,
         commit_properties=_run_commit_properties(),
     )
 
-    dt = DeltaTable(uri, storage_options=opts)
+    dt = open_table(uri, opts)
     version = dt.version()
     new_count = _target_row_count(dt)
     h = _source_hash(source, schema, new_count)
@@ -501,10 +534,12 @@ def append(
         partition_by=partition_by,
         storage_options=opts,
         schema_mode="merge",  # Allow schema evolution for append
+        target_file_size=_TARGET_FILE_SIZE,
+        writer_properties=_WRITER_PROPERTIES,
         commit_properties=_run_commit_properties(),
     )
 
-    dt = DeltaTable(uri, storage_options=opts)
+    dt = open_table(uri, opts)
     version = dt.version()
     new_count = _target_row_count(dt)
     h = _source_hash(source, schema, new_count)
@@ -1,38 +1,51 @@
 """DuckDB utilities for querying raw data."""
 
 import os
+import threading
 import duckdb
 from .config import is_cloud, raw_uri
 
-_configured = False
+_conn: duckdb.DuckDBPyConnection | None = None
+_conn_pid: int | None = None
+_lock = threading.Lock()
 
 
-def _configure():
-    """Auto-configure DuckDB for S3 if in cloud mode."""
-    global _configured
-    if _configured:
-        return
+def get_conn() -> duckdb.DuckDBPyConnection:
+    """Return this process's DuckDB connection, configured for S3 in cloud mode.
 
-    if is_cloud():
-        duckdb.sql(f"""
-            SET s3_endpoint='{os.environ['R2_ACCOUNT_ID']}.r2.cloudflarestorage.com';
-            SET s3_access_key_id='{os.environ['R2_ACCESS_KEY_ID']}';
-            SET s3_secret_access_key='{os.environ['R2_SECRET_ACCESS_KEY']}';
-            SET s3_region='auto';
-        """)
-    _configured = True
+    Created once per process (a DAG node runs in a forked child, which gets
+    its own — DuckDB connections must not cross a fork) and shared by every
+    query in it, so the S3 settings are applied exactly once.
+    """
+    global _conn, _conn_pid
+    pid = os.getpid()
+    if _conn is not None and _conn_pid == pid:
+        return _conn
+
+    with _lock:
+        if _conn is None or _conn_pid != pid:
+            conn = duckdb.connect()
+            if is_cloud():
+                conn.execute(f"SET s3_endpoint='{os.environ['R2_ACCOUNT_ID']}.r2.cloudflarestorage.com'")
+                conn.execute(f"SET s3_access_key_id='{os.environ['R2_ACCESS_KEY_ID']}'")
+                conn.execute(f"SET s3_secret_access_key='{os.environ['R2_SECRET_ACCESS_KEY']}'")
+                conn.execute("SET s3_region='auto'")
+            _conn, _conn_pid = conn, pid
+    return _conn
 
 
 def raw(assets: list[str] | str) -> str:
     """Returns read_parquet clause for DuckDB query.
 
+    Run it on `get_conn()`, which carries the S3 settings in cloud mode.
+
     Usage:
-        from subsets_utils.duckdb import raw
+        from subsets_utils.duckdb import get_conn, raw
 
-        table = duckdb.sql(f"SELECT * FROM {raw('my_asset')}").arrow()
-        table = duckdb.sql(f"SELECT * FROM {raw(['asset1', 'asset2'])}").arrow()
+        table = get_conn().sql(f"SELECT * FROM {raw('my_asset')}").arrow()
+        table = get_conn().sql(f"SELECT * FROM {raw(['asset1', 'asset2'])}").arrow()
     """
-    _configure()
+    get_conn()
     if isinstance(assets, str):
         assets = [assets]
     paths = [raw_uri(a, "parquet") for a in assets]
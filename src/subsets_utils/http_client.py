@@ -1,23 +1,50 @@
+import importlib.util
 import os
 import httpx
 import time
+from contextlib import contextmanager
+from typing import Iterator
 from . import debug
 
 _client = None
-_client_config = {
-    'timeout': int(os.environ.get('HTTP_TIMEOUT', '30')),
-    'headers': {'User-Agent': os.environ.get('HTTP_USER_AGENT', 'DataIntegrations/1.0')}
-}
+# Overrides set via configure_http(); env defaults are resolved when the
+# client is first built, so importing this module does no config work.
+_client_config = {}
+
+
+def _resolve_config() -> dict:
+    return {
+        'timeout': int(os.environ.get('HTTP_TIMEOUT', '30')),
+        'headers': {'User-Agent': os.environ.get('HTTP_USER_AGENT', 'DataIntegrations/1.0')},
+        **_client_config,
+    }
 
 
 def _get_or_create_client() -> httpx.Client:
     global _client
 
     if _client is None:
+        config = _resolve_config()
+        # httpx only needs h2 importable for http2=True; probe without importing.
+        http2 = importlib.util.find_spec('h2') is not None
+        # Connectors hit one host many times: keep connections alive, pool
+        # enough of them for concurrent callers, multiplex over HTTP/2 when
+        # the h2 extra is installed, and retry failed connects at the
+        # transport level instead of surfacing them to the caller.
         _client = httpx.Client(
-            timeout=_client_config['timeout'],
-            headers=_client_config['headers'],
-            follow_redirects=True
+            timeout=config['timeout'],
+            headers=config['headers'],
+            follow_redirects=True,
+            # An explicit transport owns the pool, so limits/http2 go on it.
+            transport=httpx.HTTPTransport(
+                http2=http2,
+                limits=httpx.Limits(
+                    max_keepalive_connections=32,
+                    max_connections=64,
+                    keepalive_expiry=60.0,
+                ),
+                retries=2,
+            ),
         )
 
     return _client
@@ -26,7 +53,7 @@ def _get_or_create_client() -> httpx.Client:
 def _logged_request(method: str, url: str, **kwargs) -> httpx.Response:
     """Execute HTTP request with logging if ENABLE_LOGGING is set."""
     client = _get_or_create_client()
-    start = time.time()
+    start = time.perf_counter()
     error = None
     status = None
 
@@ -38,7 +65,30 @@ def _logged_request(method: str, url: str, **kwargs) -> httpx.Response:
         error = str(e)
         raise
     finally:
-        duration_ms = int((time.time() - start) * 1000)
+        duration_ms = int((time.perf_counter() - start) * 1000)
+        debug.log_http_request(method, url, status, duration_ms=duration_ms, error=error)
+
+
+@contextmanager
+def stream(method: str, url: str, **kwargs) -> Iterator[httpx.Response]:
+    """Streaming variant of the request helpers. Context manager yielding a
+    response whose body is read incrementally (`iter_bytes()`), so large
+    downloads never sit in memory as a single `response.content`.
+    """
+    client = _get_or_create_client()
+    start = time.perf_counter()
+    error = None
+    status = None
+
+    try:
+        with client.stream(method, url, **kwargs) as response:
+            status = response.status_code
+            yield response
+    except Exception as e:
+        error = str(e)
+        raise
+    finally:
+        duration_ms = int((time.perf_counter() - start) * 1000)
         debug.log_http_request(method, url, status, duration_ms=duration_ms, error=error)
 
 
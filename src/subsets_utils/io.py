@@ -27,6 +27,8 @@ from pathlib import Path
 from typing import Optional
 
 import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
 import pyarrow.parquet as pq
 from deltalake import DeltaTable
 
@@ -64,17 +66,17 @@ def _read_with_mirror_fallback(uri: str, mirror: Path | None) -> Optional[bytes]
 
 def _write_bytes(uri: str, data: bytes) -> None:
     """Write bytes to a URI (s3:// or local path) via fsspec."""
-    fs = get_fs(uri)
-    with fs.open(uri, "wb") as f:
-        f.write(data)
+    # pipe_file hands the whole payload to the backend at once, so s3fs can
+    # split large objects into concurrent multipart parts.
+    get_fs(uri).pipe_file(uri, data)
 
 
 def _read_bytes(uri: str) -> Optional[bytes]:
     """Read bytes from a URI via fsspec. Returns None if not found."""
-    fs = get_fs(uri)
+    # cat_file rather than open().read(): s3fs splits objects larger than
+    # its block size into concurrent range GETs instead of one serial stream.
     try:
-        with fs.open(uri, "rb") as f:
-            return f.read()
+        return get_fs(uri).cat_file(uri)
     except FileNotFoundError:
         return None
 
@@ -136,32 +138,99 @@ def raw_parquet_hash(asset_id: str) -> str | None:
 # Subsets (published Delta tables)
 # =============================================================================
 
-def load_asset(asset_name: str) -> pa.Table:
-    """Load a published Delta table by name."""
-    from .tracking import record_read
+def _open_asset(asset_name: str) -> DeltaTable:
+    from .delta import open_table
     uri = subsets_uri(asset_name)
     opts = get_storage_options() if uri.startswith("s3://") else None
     try:
-        table = DeltaTable(uri, storage_options=opts).to_pyarrow_table()
+        return open_table(uri, opts)
     except Exception as e:
         raise FileNotFoundError(f"No Delta table found at {uri}") from e
+
+
+def load_asset(
+    asset_name: str,
+    columns: list[str] | None = None,
+    filters: pc.Expression | None = None,
+) -> pa.Table:
+    """Load a published Delta table by name.
+
+    Args:
+        columns: Only read these columns (pruned in the parquet reader).
+        filters: pyarrow dataset expression, e.g. `pc.field("year") >= 2000`.
+            Pushed down so row groups whose statistics can't match are skipped.
+    """
+    from .tracking import record_read
+    dt = _open_asset(asset_name)
+    if columns is None and filters is None:
+        table = dt.to_pyarrow_table()
+    else:
+        table = dt.to_pyarrow_dataset().to_table(columns=columns, filter=filters)
     record_read(f"subsets/{asset_name}")
     return table
 
 
+def load_asset_dataset(asset_name: str) -> ds.Dataset:
+    """Open a published Delta table as a lazy pyarrow dataset.
+
+    Only the Delta log is read here; data files are scanned when the caller
+    materializes (`to_table`, `to_batches`, `head`, ...), with its projection
+    and filter pushed down. Also queryable from DuckDB without a copy.
+    """
+    from .tracking import record_read
+    dataset = _open_asset(asset_name).to_pyarrow_dataset()
+    record_read(f"subsets/{asset_name}")
+    return dataset
+
+
 # =============================================================================
 # State files (small JSON, per-asset)
 # =============================================================================
 
+# Last-seen bytes of each state file (b"" when absent), so save_state's
+# old-state read and repeat loads in one process skip the round-trip. Keyed
+# to the pid: a forked DAG node must not trust what its parent cached,
+# since sibling nodes may have written those files since.
+_state_cache: dict[str, bytes] = {}
+_state_cache_pid: int | None = None
+
+
+def _state_cache_for_pid() -> dict[str, bytes]:
+    import os
+    global _state_cache_pid
+    if _state_cache_pid != os.getpid():
+        _state_cache.clear()
+        _state_cache_pid = os.getpid()
+    return _state_cache
+
+
 def load_state(asset: str) -> dict:
     """Load state for an asset. Returns empty dict if not found."""
-    uri = state_uri(asset)
-    data = _read_with_mirror_fallback(uri, mirror_state_path(asset))
+    cache = _state_cache_for_pid()
+    data = cache.get(asset)
+    if data is None:
+        uri = state_uri(asset)
+        data = _read_with_mirror_fallback(uri, mirror_state_path(asset)) or b""
+        cache[asset] = data
     if not data:
         return {}
+    # Decoded per call so callers can mutate the dict they get back.
     return json.loads(data.decode("utf-8"))
 
 
+def load_states(assets: list[str], max_workers: int = 16) -> dict[str, dict]:
+    """Load state for many assets concurrently. Returns {asset: state}.
+
+    Each state is a separate small GET in cloud, so fetching them in
+    parallel turns N round-trips into roughly N / max_workers.
+    """
+    if not assets:
+        return {}
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(assets))) as pool:
+        return dict(zip(assets, pool.map(load_state, assets)))
+
+
 def save_state(asset: str, state_data: dict) -> str:
     """Save state for an asset. Returns the URI."""
     import os
@@ -174,7 +243,10 @@ def save_state(asset: str, state_data: dict) -> str:
         },
     }
     uri = state_uri(asset)
-    _write_bytes(uri, json.dumps(state_data, indent=2).encode("utf-8"))
+    # Pretty-printed only for local dev, where people open these by hand.
+    data = json.dumps(state_data, indent=None if is_cloud() else 2).encode("utf-8")
+    _write_bytes(uri, data)
+    _state_cache_for_pid()[asset] = data
     debug.log_state_change(asset, old_state, state_data)
     return uri
 
@@ -194,6 +266,13 @@ def save_raw_file(content: str | bytes, asset_id: str, extension: str = "txt") -
     return uri
 
 
+# Extensions that are never text: load_raw_file returns their bytes as-is
+# instead of attempting (and failing) a full UTF-8 decode first.
+_BINARY_EXTENSIONS = frozenset({
+    "zip", "gz", "parquet", "xlsx", "xls", "pdf", "png", "jpg", "bin",
+})
+
+
 def load_raw_file(asset_id: str, extension: str = "txt", *, binary: bool = False) -> str | bytes:
     """Load a raw file.
 
@@ -202,9 +281,10 @@ def load_raw_file(asset_id: str, extension: str = "txt", *, binary: bool = False
         extension: File extension.
         binary: If True, always return bytes. If False (default), attempt
             UTF-8 decode and return str on success, bytes on failure.
-            Set binary=True for xlsx/zip/parquet or any file where you
-            need deterministic bytes — the decode fallback is unreliable
-            when a binary payload happens to be ASCII-only.
+            Known binary extensions (zip, gz, parquet, xlsx, ...) always
+            come back as bytes. Set binary=True for any other file where
+            you need deterministic bytes — the decode fallback is
+            unreliable when a binary payload happens to be ASCII-only.
     """
     from .tracking import record_read
     uri = raw_uri(asset_id, extension)
@@ -212,7 +292,7 @@ def load_raw_file(asset_id: str, extension: str = "txt", *, binary: bool = False
     if data is None:
         raise FileNotFoundError(f"Raw asset '{asset_id}.{extension}' not found at {uri}")
     record_read(f"raw/{asset_id}.{extension}")
-    if binary:
+    if binary or extension.lower() in _BINARY_EXTENSIONS:
         return data
     try:
         return data.decode("utf-8")
@@ -229,10 +309,11 @@ def save_raw_json(data, asset_id: str, compress: bool = False) -> str:
     from .tracking import record_write
     if compress:
         ext = "json.gz"
-        buf = io.BytesIO()
-        with gzip.GzipFile(fileobj=buf, mode="wb") as gz:
-            gz.write(json.dumps(data).encode("utf-8"))
-        content = buf.getvalue()
+        # One-shot compress of the encoded bytes (no BytesIO/GzipFile
+        # staging). Level 1: repetitive JSON already compresses well at the
+        # fastest setting, and these are write-once raw snapshots where
+        # encode time matters more than the last few % of size.
+        content = gzip.compress(json.dumps(data).encode("utf-8"), compresslevel=1)
     else:
         ext = "json"
         content = json.dumps(data, indent=2).encode("utf-8")
@@ -276,10 +357,11 @@ def save_raw_parquet(data: pa.Table, asset_id: str) -> str:
     from .tracking import record_write
     if hasattr(data, "read_all"):
         data = data.read_all()
-    buf = io.BytesIO()
-    pq.write_table(data, buf, compression="snappy")
     uri = raw_uri(asset_id, "parquet")
-    _write_bytes(uri, buf.getvalue())
+    # Encode straight into the fsspec handle: no BytesIO staging buffer and
+    # no getvalue() copy of the whole file (s3 uploads go out multipart).
+    with get_fs(uri).open(uri, "wb") as f:
+        pq.write_table(data, f, compression="snappy")
     print(f"  -> Saved {asset_id}.parquet ({data.num_rows:,} rows)")
     record_write(f"raw/{asset_id}.parquet")
     return uri
@@ -289,11 +371,28 @@ def load_raw_parquet(asset_id: str) -> pa.Table:
     """Load a Parquet file as PyArrow table."""
     from .tracking import record_read
     uri = raw_uri(asset_id, "parquet")
-    data = _read_with_mirror_fallback(uri, mirror_raw_path(asset_id, "parquet"))
-    if data is None:
+    if uri.startswith("s3://"):
+        # BufferReader wraps the bytes zero-copy as a random-access Arrow
+        # file, so column chunks are decoded from memory without a shim.
+        data = _read_bytes(uri)
+        source = None if data is None else pa.BufferReader(data)
+    else:
+        # Local dev file or SSD mirror: Arrow reads the column chunks from
+        # the file itself, so the whole file never sits in a bytes object.
+        # OSFile rather than memory_map: raw files are rewritten in place,
+        # and truncating a mapped file under a live table would fault.
+        mirror = mirror_raw_path(asset_id, "parquet")
+        if Path(uri).exists():
+            source = pa.OSFile(uri)
+        elif mirror is not None and mirror.exists():
+            source = pa.OSFile(str(mirror))
+        else:
+            source = None
+    if source is None:
         raise FileNotFoundError(f"Raw parquet '{asset_id}' not found at {uri}")
     record_read(f"raw/{asset_id}.parquet")
-    return pq.read_table(io.BytesIO(data))
+    with source:
+        return pq.read_table(source)
 
 
 @contextmanager
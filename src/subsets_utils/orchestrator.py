@@ -4,7 +4,7 @@ The DAG class:
 - Builds a topological order from `nodes` dict (`{fn: [deps]}`)
 - Optionally inherits state from a prior run.json (resume across invocations)
 - Runs each node in a fresh forked subprocess (memory isolation per node)
-- Writes run.json after each node
+- Writes run.json after each node (debounced; failures and the end of the run always write)
 - Marks status as "needs_continuation" if any node returns True (pagination)
 - Knows nothing about exit codes or time budgets — that's runner.py's job.
 
@@ -31,6 +31,7 @@ Resume pattern:
 """
 
 import hashlib
+import heapq
 import importlib.util
 import json
 import multiprocessing
@@ -41,6 +42,7 @@ import sys
 import tempfile
 import time
 import traceback
+from collections import deque
 from dataclasses import asdict
 from datetime import datetime, timezone
 from pathlib import Path
@@ -53,6 +55,7 @@ from .tracking import (
     get_asset_version,
     get_assets_by_writer,
     get_reads_by_task,
+    reset_current_task,
     set_current_task,
 )
 
@@ -96,7 +99,7 @@ def _atomic_write_json(path: Path, data: dict) -> None:
     try:
         with os.fdopen(fd, "w") as f:
             json.dump(data, f, indent=2)
-        os.rename(tmp, path)
+        os.replace(tmp, path)
     except Exception:
         try:
             os.unlink(tmp)
@@ -146,9 +149,10 @@ def _child_entrypoint(fn: Callable, task_id: str, pipe_w) -> None:
     signal.signal(signal.SIGINT, signal.SIG_DFL)
 
     clear_tracking()
-    set_current_task(task_id)
+    task_token = set_current_task(task_id)
 
     started_at = datetime.now(timezone.utc).isoformat()
+    t_start = time.perf_counter()
     result: dict = {
         "task_id": task_id,
         "started_at": started_at,
@@ -165,15 +169,13 @@ def _child_entrypoint(fn: Callable, task_id: str, pipe_w) -> None:
         result["status"] = "failed"
         result["error"] = str(e) or e.__class__.__name__
         result["traceback"] = traceback.format_exc()
+    finally:
+        reset_current_task(task_token)
 
+    # Duration from a monotonic clock; the ISO timestamps are for display only.
+    result["duration_s"] = time.perf_counter() - t_start
     finished_at = datetime.now(timezone.utc).isoformat()
     result["finished_at"] = finished_at
-    try:
-        result["duration_s"] = (
-            datetime.fromisoformat(finished_at) - datetime.fromisoformat(started_at)
-        ).total_seconds()
-    except Exception:
-        result["duration_s"] = 0.0
 
     result["tracking"] = {
         "asset_writers": dict(tracking._asset_writers),
@@ -225,12 +227,35 @@ class DAG:
         self._id_to_fn: dict[str, Callable] = {}
         self._needs_continuation = False
         self._shutdown_requested = False
+        self._order: list[Callable] | None = None
+        # run.json checkpoint debounce: routine saves within this many seconds
+        # of the previous write are coalesced; failures and the final save
+        # always write.
+        self._last_save = 0.0
+        try:
+            self._save_interval = float(os.environ.get("DAG_SAVE_INTERVAL", "2.0"))
+        except ValueError:
+            self._save_interval = 2.0
         self.topology_hash = _topology_hash(nodes)
 
+        # Reverse adjacency (dep → dependents), built once so ordering and
+        # scheduling visit only a node's own edges.
+        self._successors: dict[Callable, list[Callable]] = {fn: [] for fn in nodes}
+        for fn, deps in nodes.items():
+            for dep in deps:
+                self._successors[dep].append(fn)
+
+        # Target lookups for run(): module short name ("ingest") and bare
+        # function name ("run") can each match several nodes.
+        self._by_module: dict[str, list[Callable]] = {}
+        self._by_name: dict[str, list[Callable]] = {}
+
         for fn in nodes:
             task_id = _get_task_id(fn)
             self._fn_to_id[fn] = task_id
             self._id_to_fn[task_id] = fn
+            self._by_module.setdefault(task_id.split(".")[-2], []).append(fn)
+            self._by_name.setdefault(fn.__name__, []).append(fn)
             self.state[task_id] = {
                 "id": task_id,
                 "deps": [_get_task_id(d) for d in nodes[fn]],
@@ -285,24 +310,30 @@ class DAG:
     # =========================================================================
 
     def _topological_order(self) -> list[Callable]:
-        """Return functions in dependency order (Kahn's algorithm)."""
+        """Return functions in dependency order (Kahn's algorithm, O(V+E)).
+
+        Computed once and cached; the node set is fixed after __init__.
+        """
+        if self._order is not None:
+            return self._order
+
         in_degree = {fn: len(deps) for fn, deps in self.nodes.items()}
-        ready = [fn for fn, deg in in_degree.items() if deg == 0]
+        ready = deque(fn for fn, deg in in_degree.items() if deg == 0)
         order: list[Callable] = []
 
         while ready:
-            fn = ready.pop(0)
+            fn = ready.popleft()
             order.append(fn)
-            for other_fn, deps in self.nodes.items():
-                if fn in deps:
-                    in_degree[other_fn] -= 1
-                    if in_degree[other_fn] == 0:
-                        # Insert at FRONT to run dependent immediately (DFS-style),
-                        # so download→transform pairs run together.
-                        ready.insert(0, other_fn)
+            for other_fn in self._successors[fn]:
+                in_degree[other_fn] -= 1
+                if in_degree[other_fn] == 0:
+                    # Push to FRONT to run dependent immediately (DFS-style),
+                    # so download→transform pairs run together.
+                    ready.appendleft(other_fn)
 
         if len(order) != len(self.nodes):
             raise ValueError("Cycle detected in DAG")
+        self._order = order
         return order
 
     # =========================================================================
@@ -398,12 +429,13 @@ class DAG:
             for r in snapshot.get("io_records", []):
                 tracking._io_records.append(IORecord(**r))
 
-    def run(self, targets: list[str] | None = None):
+    def run(self, targets: list[str] | None = None, parallelism: int | None = None):
         """Execute all nodes in dependency order, each in its own forked
         subprocess. Writes run.json after every node.
 
         Args:
             targets: Optional list of node names to run (assumes deps already ran).
+            parallelism: Max concurrent nodes (overridden by DAG_PARALLELISM).
 
         Env vars:
             DAG_TARGET: Comma-separated node names to run (overrides `targets`).
@@ -426,7 +458,7 @@ class DAG:
 
         on_failure = os.environ.get("DAG_ON_FAILURE", "crash")
         try:
-            parallelism = max(1, int(os.environ.get("DAG_PARALLELISM", "1")))
+            parallelism = max(1, int(os.environ.get("DAG_PARALLELISM", parallelism or 1)))
         except ValueError:
             parallelism = 1
         env_targets = os.environ.get("DAG_TARGET")
@@ -436,21 +468,19 @@ class DAG:
         order = self._topological_order()
 
         if targets:
-            target_set = set(targets)
-            order = [
-                fn for fn in order
-                if self._fn_to_id[fn].split(".")[-2] in target_set
-            ]
-            if not order:
-                # Fall back to matching full task_id or function name
-                order = [
-                    fn for fn in self._topological_order()
-                    if self._fn_to_id[fn] in target_set or fn.__name__ in target_set
-                ]
+            # Match by module short name first; fall back to full task_id or
+            # function name only if no module matched.
+            matched = {fn for t in targets for fn in self._by_module.get(t, [])}
+            if not matched:
+                for t in targets:
+                    if t in self._id_to_fn:
+                        matched.add(self._id_to_fn[t])
+                    matched.update(self._by_name.get(t, []))
+            order = [fn for fn in order if fn in matched]
             if not order:
                 print(f"[DAG] No nodes matched targets: {targets}")
                 print(f"[DAG] Available: {[self._fn_to_id[fn] for fn in self.nodes]}")
-                self.save_state()
+                self.save_state(force=True)
                 return self
             # Mark all non-targeted nodes as "skipped" so the run can finalize as
             # done even though only a subset executed.
@@ -469,26 +499,58 @@ class DAG:
         first_failure = None
         stop_submitting = False
 
-        def find_ready() -> list[Callable]:
-            """Return pending nodes whose deps are done, in topological order.
-            Skips nodes whose deps already failed (marks them skipped)."""
-            ready: list[Callable] = []
-            for fn in order:
-                task_id = self._fn_to_id[fn]
-                if self.state[task_id]["status"] != "pending":
+        # Event-driven ready queue (Kahn): each pending node tracks how many
+        # of its deps are not yet done and becomes ready when that hits zero,
+        # so completions only touch their own successors instead of
+        # rescanning the whole order. Ready nodes are dispatched in
+        # topological order (heap keyed by position in `order`).
+        position = {fn: i for i, fn in enumerate(order)}
+        successors = self._successors
+        waiting: dict[Callable, int] = {}
+        ready_heap: list[tuple[int, Callable]] = []
+
+        def skip(fn: Callable) -> None:
+            """Mark a pending node (and transitively its pending dependents)
+            skipped because an upstream dependency did not complete."""
+            task_id = self._fn_to_id[fn]
+            if self.state[task_id]["status"] != "pending":
+                return
+            waiting.pop(fn, None)
+            self.state[task_id]["status"] = "skipped"
+            self.state[task_id]["error"] = "Upstream dependency did not complete"
+            self.save_state()
+            for succ in successors[fn]:
+                skip(succ)
+
+        for fn in order:
+            task_id = self._fn_to_id[fn]
+            if self.state[task_id]["status"] != "pending":
+                continue
+            dep_states = [
+                self.state[self._fn_to_id[dep]]["status"]
+                for dep in self.nodes[fn]
+            ]
+            if any(s in ("failed", "skipped") for s in dep_states):
+                skip(fn)
+                continue
+            remaining = sum(1 for s in dep_states if s != "done")
+            if remaining:
+                waiting[fn] = remaining
+            else:
+                heapq.heappush(ready_heap, (position[fn], fn))
+
+        def release(fn: Callable, status: str) -> None:
+            """Propagate a finished node to its dependents."""
+            for succ in successors[fn]:
+                if succ not in waiting:
                     continue
-                dep_states = [
-                    self.state[self._fn_to_id[dep]]["status"]
-                    for dep in self.nodes[fn]
-                ]
-                if any(s in ("failed", "skipped") for s in dep_states):
-                    self.state[task_id]["status"] = "skipped"
-                    self.state[task_id]["error"] = "Upstream dependency did not complete"
-                    self.save_state()
+                if status != "done":
+                    skip(succ)
                     continue
-                if all(s == "done" for s in dep_states):
-                    ready.append(fn)
-            return ready
+                waiting[succ] -= 1
+                if waiting[succ] == 0:
+                    del waiting[succ]
+                    heapq.heappush(ready_heap, (position[succ], succ))
 
         # Each node runs in its own forked subprocess so memory is reclaimed
         # between nodes. in_flight maps a live Process to its (task_id, pipe_r).
@@ -501,8 +563,8 @@ class DAG:
         #   thrashes — but the OOM killer already reaped the offending child,
         #   so we can keep going. If GH really wants us dead it sends SIGKILL
         #   ~10s after SIGTERM, which we cannot catch, and the step dies hard.
-        #   That is acceptable: save_state runs after every node so at most a
-        #   few seconds of progress is lost.
+        #   That is acceptable: save_state runs after every node (debounced to
+        #   DAG_SAVE_INTERVAL) so at most a few seconds of progress is lost.
         #
         # - "crash" (default): drain in-flight, mark pending, exit. Used by
         #   callers who want a single failure to halt the run cleanly.
@@ -528,12 +590,10 @@ class DAG:
         def submit_more():
             if stop_submitting:
                 return
-            for fn in find_ready():
-                if len(in_flight) >= parallelism:
-                    return
+            while ready_heap and len(in_flight) < parallelism:
+                _, fn = heapq.heappop(ready_heap)
                 task_id = self._fn_to_id[fn]
-                # Reserve the slot before fork so the next find_ready() doesn't
-                # see this node as pending and re-spawn it.
+                # Mark running before fork so run.json reflects the in-flight node.
                 self.state[task_id]["status"] = "running"
                 self.state[task_id]["started_at"] = datetime.now(timezone.utc).isoformat()
                 print(f"[DAG] Running {task_id}...")
@@ -545,7 +605,7 @@ class DAG:
             task_id, pipe_r = in_flight.pop(proc)
             result = self._collect_result(proc, pipe_r)
             self._apply_result(task_id, result)
-            self.save_state()
+            self.save_state(force=result["status"] != "done")
             return result
 
         try:
@@ -563,6 +623,7 @@ class DAG:
                 for proc in done_procs:
                     task_id, _ = in_flight[proc]
                     result = collect_one(proc)
+                    fn = self._id_to_fn[task_id]
 
                     if result["status"] == "done":
                         cont_msg = " (needs continuation)" if result.get("needs_continuation") else ""
@@ -570,12 +631,15 @@ class DAG:
                         print(f"[DAG] {task_id} done ({duration:.1f}s){cont_msg}")
                         if os.environ.get("DAG_VERBOSE") == "1":
                             self._print_node_detail(task_id)
+                        release(fn, "done")
                     else:
                         print(f"[DAG] {task_id} failed: {result.get('error', 'unknown')}")
                         if first_failure is None:
                             first_failure = result
                         if on_failure == "crash":
                             stop_submitting = True
+                        else:
+                            release(fn, "failed")
 
                 if self._shutdown_requested:
                     break
@@ -623,7 +687,7 @@ class DAG:
                         "needs_continuation": False,
                         "tracking": {"asset_writers": {}, "asset_versions": {}, "io_records": []},
                     })
-                    self.save_state()
+                    self.save_state(force=True)
                     if first_failure is None:
                         first_failure = self.state[task_id]
         finally:
@@ -634,7 +698,7 @@ class DAG:
                 pass
 
         # Final state save with overall status
-        self.save_state()
+        self.save_state(force=True)
 
         if first_failure is not None:
             failed_id = first_failure.get("id") or first_failure.get("task_id") or "unknown"
@@ -748,11 +812,19 @@ class DAG:
             },
         }
 
-    def save_state(self):
-        """Write run.json to LOG_DIR. Called after each node, can also be called explicitly."""
+    def save_state(self, force: bool = False):
+        """Write run.json to LOG_DIR. Called after each node, can also be called explicitly.
+
+        Unforced calls within DAG_SAVE_INTERVAL seconds (default 2) of the
+        last write are skipped; the next write carries their changes.
+        """
         log_dir = os.environ.get("LOG_DIR")
         if not log_dir:
             return  # Local dev without runner — skip persistence
+        now = time.monotonic()
+        if not force and now - self._last_save < self._save_interval:
+            return
+        self._last_save = now
         path = Path(log_dir) / "run.json"
         # Preserve invocations array from prior state if present
         existing = _load_run_state(Path(log_dir)) or {}
@@ -1,6 +1,6 @@
 import json
-from deltalake import DeltaTable
 from .config import subsets_uri, get_storage_options
+from .delta import open_table
 
 
 def publish(dataset_name: str, metadata: dict):
@@ -12,7 +12,7 @@ def publish(dataset_name: str, metadata: dict):
 
     uri = subsets_uri(dataset_name)
     storage_opts = get_storage_options()
-    dt = DeltaTable(uri, storage_options=storage_opts) if storage_opts else DeltaTable(uri)
+    dt = open_table(uri, storage_opts)
 
     # Idempotent: skip if metadata unchanged
     existing = json.loads(dt.metadata().description or "{}")
@@ -21,7 +21,9 @@ def publish(dataset_name: str, metadata: dict):
         return
 
     # Validate column descriptions against actual schema
-    schema = dt.schema().to_pyarrow() if hasattr(dt.schema(), 'to_pyarrow') else dt.schema().to_arrow()
+    # Schema comes from the Delta log alone; no data files are read here.
+    delta_schema = dt.schema()
+    schema = delta_schema.to_pyarrow() if hasattr(delta_schema, 'to_pyarrow') else delta_schema.to_arrow()
     actual_columns = {field.name for field in schema}
 
     if 'column_descriptions' in metadata:
@@ -29,6 +29,8 @@ import signal
 import subprocess
 import sys
 import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from zoneinfo import ZoneInfo
@@ -48,9 +50,7 @@ def _r2_uri(key: str) -> str:
 
 def _r2_upload_bytes(data: bytes, key: str) -> None:
     uri = _r2_uri(key)
-    fs = get_fs(uri)
-    with fs.open(uri, "wb") as f:
-        f.write(data)
+    get_fs(uri).pipe_file(uri, data)
 
 
 def _r2_upload_file(path: str, key: str) -> None:
@@ -61,10 +61,8 @@ def _r2_upload_file(path: str, key: str) -> None:
 
 def _r2_download_bytes(key: str) -> bytes | None:
     uri = _r2_uri(key)
-    fs = get_fs(uri)
     try:
-        with fs.open(uri, "rb") as f:
-            return f.read()
+        return get_fs(uri).cat_file(uri)
     except FileNotFoundError:
         return None
 
@@ -73,6 +71,17 @@ def _r2_download_bytes(key: str) -> bytes | None:
 # Memory profiler (external — observes subprocess from parent)
 # =============================================================================
 
+def _memory_sample(process) -> tuple[int, int, float]:
+    """(rss, vms, percent) for one process from a single /proc read.
+
+    memory_info() is called once and its rss/vms both used; oneshot() lets
+    memory_percent() reuse that same read instead of issuing its own.
+    """
+    with process.oneshot():
+        info = process.memory_info()
+        return info.rss, info.vms, process.memory_percent()
+
+
 class MemoryProfiler:
     """Sample subprocess memory every N seconds, write to memory.csv."""
 
@@ -104,33 +113,38 @@ class MemoryProfiler:
         except psutil.NoSuchProcess:
             return
 
+        # Opened once for the whole run rather than re-opened per sample.
         with open(self.log_file, "w", newline="") as f:
-            csv.writer(f).writerow(["timestamp", "rss_mb", "vms_mb", "pct"])
+            writer = csv.writer(f)
+            writer.writerow(["timestamp", "rss_mb", "vms_mb", "pct"])
 
-        while not self._stop.is_set():
-            try:
-                rss = process.memory_info().rss
-                vms = process.memory_info().vms
-                pct = process.memory_percent()
-                for child in process.children(recursive=True):
-                    try:
-                        rss += child.memory_info().rss
-                        vms += child.memory_info().vms
-                        pct += child.memory_percent()
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
-                        pass
-
-                with open(self.log_file, "a", newline="") as f:
-                    csv.writer(f).writerow([
+            while not self._stop.is_set():
+                try:
+                    rss, vms, pct = _memory_sample(process)
+                    # Children are re-listed every tick: DAG nodes are forked
+                    # per node and may live for less than a sampling interval.
+                    for child in process.children(recursive=True):
+                        try:
+                            c_rss, c_vms, c_pct = _memory_sample(child)
+                        except (psutil.NoSuchProcess, psutil.AccessDenied):
+                            continue
+                        rss += c_rss
+                        vms += c_vms
+                        pct += c_pct
+
+                    writer.writerow([
                         datetime.now().isoformat(),
                         round(rss / 1024 / 1024, 1),
                         round(vms / 1024 / 1024, 1),
                         round(pct, 1),
                     ])
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                break
+                    # One write() per sample; the file is read as soon as the
+                    # run ends, and stop() only waits briefly for this thread.
+                    f.flush()
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    break
 
-            self._stop.wait(self.interval)
+                self._stop.wait(self.interval)
 
 
 # =============================================================================
@@ -143,8 +157,10 @@ def write_error_log(log_dir: Path, exit_code: int, output_file: Path, tail_lines
     if not output_file.exists():
         error_file.write_text(f"Exit code: {exit_code}\nNo output captured.\n")
         return
-    lines = output_file.read_text().splitlines(keepends=True)
-    tail = lines[-tail_lines:] if len(lines) > tail_lines else lines
+    # Stream the log through a bounded deque: only the tail is ever held,
+    # however large output.log grew before the crash.
+    with open(output_file) as f:
+        tail = list(deque(f, maxlen=tail_lines))
     with open(error_file, "w") as f:
         f.write(f"Exit code: {exit_code}\n")
         f.write(f"Last {len(tail)} lines of output:\n")
@@ -266,9 +282,8 @@ def _build_server_run_payload(connector: str, run_id: str, log_dir: Path) -> dic
     memory_csv = log_dir / "memory.csv"
     if memory_csv.exists():
         try:
-            import csv as csv_mod
             with open(memory_csv) as f:
-                reader = csv_mod.DictReader(f)
+                reader = csv.DictReader(f)
                 peak_rss = 0
                 for row in reader:
                     rss_mb = float(row["rss_mb"])
@@ -508,14 +523,21 @@ def main():
         # Evacuate invocation logs to R2 under <connector>/runs/<run_id>/
         prefix = _connector_runs_prefix(connector, run_id)
         print(f"Uploading logs to R2 under {prefix}/...")
-        for log in log_dir.rglob("*"):
-            if log.is_file():
-                try:
+        # Each upload is an independent PUT; run them concurrently so the
+        # teardown costs about one round-trip rather than one per file.
+        # Results are reported afterwards in the original file order.
+        uploads = []
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            for log in log_dir.rglob("*"):
+                if log.is_file():
                     key = f"{prefix}/{log.relative_to(log_dir)}"
-                    _r2_upload_file(str(log), key)
-                    print(f"  -> {key}")
-                except Exception as e:
-                    print(f"  Failed to upload {log.name}: {e}")
+                    uploads.append((log, key, pool.submit(_r2_upload_file, str(log), key)))
+        for log, key, future in uploads:
+            try:
+                future.result()
+                print(f"  -> {key}")
+            except Exception as e:
+                print(f"  Failed to upload {log.name}: {e}")
 
         # Upload enriched run manifest to server-accessible R2 path
         _upload_server_run_manifest(connector, run_id, log_dir)
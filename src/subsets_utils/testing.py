@@ -29,63 +29,85 @@ Usage in asset test.py:
 
 import re
 import pyarrow as pa
+import pyarrow.compute as pc
 
 
 # =============================================================================
 # Date Format Validators
 # =============================================================================
 
+YEAR_PATTERN = r"^\d{4}$"
+QUARTER_PATTERN = r"^\d{4}-Q[1-4]$"
+MONTH_PATTERN = r"^\d{4}-(0[1-9]|1[0-2])$"
+WEEK_PATTERN = r"^\d{4}-W(0[1-9]|[1-4]\d|5[0-3])$"
+DATE_PATTERN = r"^\d{4}-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])$"
+
+
+def _is_string_type(t: pa.DataType) -> bool:
+    if pa.types.is_dictionary(t):
+        t = t.value_type
+    return pa.types.is_string(t) or pa.types.is_large_string(t)
+
+
+def _values_not_matching(table: pa.Table, column: str, patterns: list[str]) -> list:
+    """Non-null values of `column` whose string form matches none of `patterns`.
+
+    For string columns, matching runs as an Arrow regex kernel over the
+    whole column, so valid rows never get materialized as Python objects —
+    only the offenders do. Other types are checked against `str(v)` in
+    Python: Arrow's string cast renders e.g. float 2020.0 as "2020", which
+    would let a non-integer year column pass.
+    """
+    col = table.column(column)
+    if not _is_string_type(col.type):
+        regexes = [re.compile(p) for p in patterns]
+        return [
+            v for v in col.to_pylist()
+            if v is not None and not any(r.match(str(v)) for r in regexes)
+        ]
+    as_str = pc.cast(col, col.type.value_type) if pa.types.is_dictionary(col.type) else col
+    matched = pc.match_substring_regex(as_str, patterns[0])
+    for pattern in patterns[1:]:
+        matched = pc.or_(matched, pc.match_substring_regex(as_str, pattern))
+    # Nulls propagate through the match; they are skipped, not invalid.
+    return col.filter(pc.invert(pc.fill_null(matched, True))).to_pylist()
+
+
 def assert_valid_year(table: pa.Table, column: str) -> None:
     """Assert all non-null values are valid years (YYYY format, 4 digits)."""
-    values = [v for v in table.column(column).to_pylist() if v is not None]
-    pattern = re.compile(r"^\d{4}$")
-    invalid = [v for v in values if not pattern.match(str(v))]
+    invalid = _values_not_matching(table, column, [YEAR_PATTERN])
     assert not invalid, f"Column '{column}' has invalid year values: {invalid[:5]}..."
 
 
 def assert_valid_quarter(table: pa.Table, column: str) -> None:
     """Assert all non-null values are valid quarters (YYYY-QN format)."""
-    values = [v for v in table.column(column).to_pylist() if v is not None]
-    pattern = re.compile(r"^\d{4}-Q[1-4]$")
-    invalid = [v for v in values if not pattern.match(str(v))]
+    invalid = _values_not_matching(table, column, [QUARTER_PATTERN])
     assert not invalid, f"Column '{column}' has invalid quarter values: {invalid[:5]}..."
 
 
 def assert_valid_month(table: pa.Table, column: str) -> None:
     """Assert all non-null values are valid months (YYYY-MM format)."""
-    values = [v for v in table.column(column).to_pylist() if v is not None]
-    pattern = re.compile(r"^\d{4}-(0[1-9]|1[0-2])$")
-    invalid = [v for v in values if not pattern.match(str(v))]
+    invalid = _values_not_matching(table, column, [MONTH_PATTERN])
     assert not invalid, f"Column '{column}' has invalid month values: {invalid[:5]}..."
 
 
 def assert_valid_week(table: pa.Table, column: str) -> None:
     """Assert all non-null values are valid weeks (YYYY-WNN format)."""
-    values = [v for v in table.column(column).to_pylist() if v is not None]
-    pattern = re.compile(r"^\d{4}-W(0[1-9]|[1-4]\d|5[0-3])$")
-    invalid = [v for v in values if not pattern.match(str(v))]
+    invalid = _values_not_matching(table, column, [WEEK_PATTERN])
     assert not invalid, f"Column '{column}' has invalid week values: {invalid[:5]}..."
 
 
 def assert_valid_date(table: pa.Table, column: str) -> None:
     """Assert all non-null values are valid dates (YYYY-MM-DD format)."""
-    values = [v for v in table.column(column).to_pylist() if v is not None]
-    pattern = re.compile(r"^\d{4}-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])$")
-    invalid = [v for v in values if not pattern.match(str(v))]
+    invalid = _values_not_matching(table, column, [DATE_PATTERN])
     assert not invalid, f"Column '{column}' has invalid date values: {invalid[:5]}..."
 
 
 def assert_valid_date_any(table: pa.Table, column: str) -> None:
     """Assert all non-null values match one of: YYYY, YYYY-QN, YYYY-MM, YYYY-WNN, YYYY-MM-DD."""
-    values = [v for v in table.column(column).to_pylist() if v is not None]
-    patterns = [
-        re.compile(r"^\d{4}$"),  # Year
-        re.compile(r"^\d{4}-Q[1-4]$"),  # Quarter
-        re.compile(r"^\d{4}-(0[1-9]|1[0-2])$"),  # Month
-        re.compile(r"^\d{4}-W(0[1-9]|[1-4]\d|5[0-3])$"),  # Week
-        re.compile(r"^\d{4}-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])$"),  # Date
-    ]
-    invalid = [v for v in values if not any(p.match(str(v)) for p in patterns)]
+    invalid = _values_not_matching(table, column, [
+        YEAR_PATTERN, QUARTER_PATTERN, MONTH_PATTERN, WEEK_PATTERN, DATE_PATTERN,
+    ])
     assert not invalid, f"Column '{column}' has invalid date values: {invalid[:5]}..."
 
 
@@ -211,13 +233,10 @@ def validate(table: pa.Table, schema: dict) -> None:
         if isinstance(unique, str):
             unique = [unique]
 
+        # Hash group_by on the typed columns; no Python-side value lists.
+        distinct = table.select(unique).group_by(unique).aggregate([]).num_rows
+        duplicates = len(table) - distinct
         if len(unique) == 1:
-            values = table.column(unique[0]).to_pylist()
-            duplicates = len(values) - len(set(values))
             assert duplicates == 0, f"Column '{unique[0]}' has {duplicates} duplicate values"
         else:
-            # Composite key - convert columns once, then zip
-            columns_as_lists = [table.column(col).to_pylist() for col in unique]
-            rows = list(zip(*columns_as_lists))
-            duplicates = len(rows) - len(set(rows))
             assert duplicates == 0, f"Columns {unique} have {duplicates} duplicate combinations"
@@ -9,7 +9,7 @@ Tracks:
 - The function stack at time of IO (to trace back through helper functions)
 """
 
-from contextvars import ContextVar
+from contextvars import ContextVar, Token
 from dataclasses import dataclass, field
 import threading
 import traceback
@@ -54,9 +54,18 @@ def _get_caller_stack(skip_frames: int = 3) -> list[str]:
     return result[-5:]  # Keep last 5 relevant frames
 
 
-def set_current_task(task_id: str | None):
-    """Set the currently executing task ID. Called by orchestrator."""
-    _current_task_id.set(task_id)
+def set_current_task(task_id: str | None) -> Token:
+    """Set the currently executing task ID. Called by orchestrator.
+
+    Returns the ContextVar token; pass it to reset_current_task() to restore
+    the previous binding rather than overwriting it with None.
+    """
+    return _current_task_id.set(task_id)
+
+
+def reset_current_task(token: Token) -> None:
+    """Restore the task ID that was current before set_current_task()."""
+    _current_task_id.reset(token)
 
 
 def get_current_task() -> str | None: